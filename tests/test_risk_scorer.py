@@ -0,0 +1,200 @@
+"""Parity tests: batch scoring must agree with score_transaction."""
+
+import importlib.util
+import itertools
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TOOLS = Path(__file__).resolve().parents[1] / "tools"
+sys.path.insert(0, str(TOOLS))
+
+import risk_scorer  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def load_fresh():
+    """Load a fresh copy of risk_scorer, with its own batch kernel cache."""
+    spec = importlib.util.spec_from_file_location("risk_scorer_fresh", TOOLS / "risk_scorer.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+COUNTRIES = ["TR", "IR", "RU", "AE", "US", "KP", "de", "ır", "XX", "", "TUR"]
+CRYPTOS = ["BTC", "XMR", "xmr", "USDT", "DASH", "XMR ", "ETHEREUM", "", "ÖZEC"]
+AMOUNTS = [0, 9999.99, 10000, 99999, 100000]
+
+# (is_new_customer, days_since_deposit, has_economic_purpose)
+FLAGS = [(False, 30, True), (True, 1, False), (False, 2, True), (True, 3, True)]
+
+
+def cases():
+    """Transactions covering every country pair with varied other inputs."""
+    other = itertools.cycle(itertools.product(CRYPTOS, AMOUNTS, FLAGS))
+    for (from_country, to_country), (crypto, amount, flags) in zip(
+        itertools.product(COUNTRIES, COUNTRIES), other
+    ):
+        yield (from_country, to_country, amount, crypto) + flags
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchParityTest(unittest.TestCase):
+    """score_transactions_batch and score_dataframe against score_transaction."""
+
+    def assert_parity(self, module):
+        scorer = module.TurkeyCorridorRiskScorer()
+        rows = list(cases())
+        columns = [np.array(column) for column in zip(*rows)]
+        batch = scorer.score_transactions_batch(*columns)
+
+        for i, row in enumerate(rows):
+            expected = scorer.score_transaction(*row)
+            got = (
+                int(batch["score"][i]),
+                module.RISK_LEVEL_ORDER[batch["level"][i]],
+                int(batch["country_risk"][i]),
+                bool(batch["edd_required"][i]),
+                bool(batch["block_recommended"][i]),
+            )
+            self.assertEqual(
+                got,
+                (
+                    expected.score,
+                    expected.overall_level,
+                    int(expected.country_risk),
+                    expected.edd_required,
+                    expected.block_recommended,
+                ),
+                msg=repr(row),
+            )
+
+    def test_batch_matches_scalar_with_numba(self):
+        if risk_scorer._batch_kernel() is None:
+            self.skipTest("numba is not installed")
+        self.assert_parity(risk_scorer)
+
+    def test_batch_matches_scalar_without_numba(self):
+        with mock.patch.dict(sys.modules, {"numba": None}):
+            module = load_fresh()
+            self.assertIsNone(module._batch_kernel())
+            self.assert_parity(module)
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_dataframe_defaults_missing_values(self):
+        scorer = risk_scorer.TurkeyCorridorRiskScorer()
+        df = pd.DataFrame({
+            "from_country": ["TR", "US", "TR"],
+            "to_country": ["RU", "DE", "AE"],
+            "amount_usd": [50000.0, 10.0, 20000.0],
+            "crypto_type": ["USDT", None, "XMR"],
+            "is_new_customer": pd.array([True, None, False], dtype="boolean"),
+            "days_since_deposit": pd.array([1, None, 5], dtype="Int64"),
+            "has_economic_purpose": pd.array([None, False, True], dtype="boolean"),
+        })
+        expected = [
+            scorer.score_transaction("TR", "RU", 50000.0, "USDT", True, 1, True).score,
+            scorer.score_transaction("US", "DE", 10.0, "BTC", False, 30, False).score,
+            scorer.score_transaction("TR", "AE", 20000.0, "XMR", False, 5, True).score,
+        ]
+        self.assertEqual(scorer.score_dataframe(df)["score"].tolist(), expected)
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_dataframe_missing_crypto_defaults_to_btc(self):
+        class WeightedBTC(risk_scorer.TurkeyCorridorRiskScorer):
+            HIGH_RISK_CRYPTO = {**risk_scorer.TurkeyCorridorRiskScorer.HIGH_RISK_CRYPTO, "BTC": 5}
+
+        scorer = WeightedBTC()
+        df = pd.DataFrame({
+            "from_country": ["US", "US"],
+            "to_country": ["DE", "DE"],
+            "amount_usd": [10.0, 10.0],
+            "crypto_type": [None, "XMR"],
+        })
+        expected = [
+            scorer.score_transaction("US", "DE", 10.0, "BTC").score,
+            scorer.score_transaction("US", "DE", 10.0, "XMR").score,
+        ]
+        self.assertEqual(scorer.score_dataframe(df)["score"].tolist(), expected)
+        self.assertEqual(scorer.score_dataframe(df.drop(columns="crypto_type"))["score"].tolist(), [expected[0]] * 2)
+
+
+class TextTest(unittest.TestCase):
+    """Factor and recommendation text formatted from the result masks."""
+
+    def test_scored_text(self):
+        result = risk_scorer.TurkeyCorridorRiskScorer().score_transaction("IR", "TR", 150000, "XMR", True, 1, False)
+        self.assertEqual(result.factors, [
+            "⛔ PROHIBITED: Transaction involves sanctioned jurisdiction (IR/TR)",
+            "🚨 CORRIDOR ALERT: Transaction pattern matches Turkey-Iran-Russia sanctions evasion corridor",
+            "💰 HIGH-RISK CRYPTO: XMR has elevated privacy/evasion risk",
+            "💵 LARGE AMOUNT: $150,000 exceeds $100,000 threshold",
+            "👤 NEW CUSTOMER: Relationship less than 30 days",
+            "⚡ RAPID MOVEMENT: Funds withdrawn 1 days after deposit",
+            "❓ NO CLEAR PURPOSE: Transaction lacks apparent economic rationale",
+        ])
+        self.assertEqual(result.recommendations, [
+            "BLOCK: Transaction involves comprehensively sanctioned jurisdiction",
+            "Manual review required - corridor transaction",
+            "Monero transactions cannot be traced - extra caution required",
+            "Verify customer identity and source of funds",
+            "Review for potential layering activity",
+            "Request documentation of transaction purpose",
+        ])
+
+    def test_constructed_result_text(self):
+        result = risk_scorer.RiskScore(
+            overall_level=risk_scorer.RiskLevel.MEDIUM,
+            score=35,
+            country_risk=risk_scorer.CountryRisk.STANDARD,
+            factors_mask=risk_scorer.FactorBit.HIGH_RISK_CRYPTO | risk_scorer.FactorBit.SIGNIFICANT_AMOUNT,
+            recommendations_mask=risk_scorer.RecommendationBit.EDD | risk_scorer.RecommendationBit.MANUAL_REVIEW,
+            edd_required=False,
+            block_recommended=False,
+            details=("US", "DE", 12345.6, "dash", 30),
+        )
+        self.assertEqual(result.factors, [
+            "💰 HIGH-RISK CRYPTO: dash has elevated privacy/evasion risk",
+            "💵 SIGNIFICANT AMOUNT: $12,346",
+        ])
+        self.assertEqual(result.recommendations, [
+            "Enhanced due diligence required",
+            "Manual compliance review recommended before processing",
+        ])
+
+
+class ProhibitedSubclass(risk_scorer.TurkeyCorridorRiskScorer):
+    COUNTRY_RISK = {
+        **risk_scorer.TurkeyCorridorRiskScorer.COUNTRY_RISK,
+        "AF": risk_scorer.CountryRisk.PROHIBITED,
+    }
+
+
+class SubclassConfigTest(unittest.TestCase):
+    """Lookup tables follow a subclass's class attributes."""
+
+    def test_subclass_country_risk_is_scored(self):
+        result = ProhibitedSubclass().score_transaction("TR", "AF", 100.0)
+        self.assertEqual(result.country_risk, risk_scorer.CountryRisk.PROHIBITED)
+        self.assertTrue(result.block_recommended)
+        self.assertEqual(result.overall_level, risk_scorer.RiskLevel.CRITICAL)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_subclass_country_risk_is_batch_scored(self):
+        batch = ProhibitedSubclass().score_transactions_batch(np.array(["TR"]), np.array(["AF"]), 100.0)
+        self.assertEqual(int(batch["country_risk"][0]), risk_scorer.CountryRisk.PROHIBITED)
+        self.assertTrue(batch["block_recommended"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""Parity tests: the array APIs must agree with their per-transaction counterparts."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from threshold_calculator import (  # noqa: E402
+    TRANSACTION_TYPE_ORDER,
+    MASAKThresholdCalculator,
+    NoteBit,
+    ThresholdResult,
+    TransactionType,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+CODES = {t.value: code for code, t in enumerate(TRANSACTION_TYPE_ORDER)}
+
+# (amount_try, type) batches; the averages sit inside the structuring band
+# (80-100% of a threshold) of one or more THRESHOLDS keys, or outside all
+BATCHES = [
+    [],
+    [(70_000, "cash")],
+    [(70_000, "wire_transfer"), (70_000, "cash"), (70_000, "wire_transfer")],
+    [(90_000, "cash"), (85_000, "crypto_deposit"), (95_000, "cash")],
+    [(13_000, "crypto_withdrawal"), (14_000, "crypto_withdrawal")],
+    [(450_000, "fiat_deposit"), (420_000, "fiat_withdrawal")],
+    [(1_000, "crypto_transfer"), (2_000, "cash"), (3_000, "fiat_deposit")],
+    [(60_000, "fiat_withdrawal"), (74_999, "cash"), (500_000, "crypto_transfer"), (10, "cash")],
+]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchTest(unittest.TestCase):
+    """calculate_batch against calculate."""
+
+    def test_matches_calculate(self):
+        calculator = MASAKThresholdCalculator(usd_try_rate=40.0)
+        amounts = [0, 1_000, 14_999, 15_000, 74_999, 75_000, 99_999, 100_000, 500_000, 2_000.5]
+        rows = [
+            (code, amount, in_usd)
+            for code in range(len(TRANSACTION_TYPE_ORDER))
+            for amount in amounts
+            for in_usd in (False, True)
+        ]
+        codes, batch_amounts, in_usd = (np.array(column) for column in zip(*rows))
+        batch = calculator.calculate_batch(codes, batch_amounts, in_usd)
+
+        for i, (code, amount, usd) in enumerate(rows):
+            expected = calculator.calculate(
+                TRANSACTION_TYPE_ORDER[code],
+                amount_try=None if usd else amount,
+                amount_usd=amount if usd else None,
+            )
+            self.assertEqual(
+                (
+                    float(batch["amount_try"][i]),
+                    float(batch["amount_usd"][i]),
+                    bool(batch["requires_reporting"][i]),
+                    bool(batch["travel_rule_applies"][i]),
+                    bool(batch["edd_required"][i]),
+                ),
+                (
+                    expected.amount_try,
+                    expected.amount_usd,
+                    expected.requires_reporting,
+                    expected.travel_rule_applies,
+                    expected.edd_required,
+                ),
+                msg=repr(rows[i]),
+            )
+
+    def test_rejects_invalid_type_codes(self):
+        calculator = MASAKThresholdCalculator()
+        for codes in ([0, len(TRANSACTION_TYPE_ORDER)], [-1, 0], -1):
+            with self.assertRaises(ValueError):
+                calculator.calculate_batch(codes, [1.0, 2.0])
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class CumulativeArrayTest(unittest.TestCase):
+    """calculate_cumulative_array against calculate_cumulative."""
+
+    def setUp(self):
+        self.calculator = MASAKThresholdCalculator()
+
+    def test_matches_calculate_cumulative(self):
+        for batch in BATCHES:
+            transactions = [{"amount_try": amount, "type": tx_type} for amount, tx_type in batch]
+            expected = self.calculator.calculate_cumulative(transactions)
+            got = self.calculator.calculate_cumulative_array(
+                np.array([amount for amount, _ in batch], dtype=np.float64),
+                np.array([CODES[tx_type] for _, tx_type in batch], dtype=np.int64),
+            )
+            self.assertEqual(got, expected, msg=repr(batch))
+            self.assertEqual(got.notes, expected.notes, msg=repr(batch))
+
+    def test_structuring_alerts(self):
+        result = self.calculator.calculate_cumulative_array(np.array([70_000.0, 70_000.0]))
+        structuring = [
+            NoteBit.STRUCTURING << i
+            for i, key in enumerate(self.calculator.THRESHOLDS)
+            if key in ("wire_transfer_reporting", "large_crypto")
+        ]
+        for bit in structuring:
+            self.assertTrue(result.notes_mask & bit)
+        self.assertEqual(sum(note.startswith("⚠️ STRUCTURING ALERT") for note in result.notes), 2)
+
+    def test_rejects_invalid_type_codes(self):
+        for codes in ([0, len(TRANSACTION_TYPE_ORDER)], [-1, 0]):
+            with self.assertRaises(ValueError):
+                self.calculator.calculate_cumulative_array([1.0, 2.0], codes)
+
+    def test_rejects_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_cumulative_array([1.0, 2.0], [0])
+
+
+class NotesTest(unittest.TestCase):
+    """Note text formatted from ThresholdResult.notes_mask."""
+
+    def test_calculated_notes(self):
+        result = MASAKThresholdCalculator().calculate(TransactionType.CRYPTO_WITHDRAWAL, 600_000)
+        self.assertEqual(result.notes, [
+            "Exceeds crypto threshold of 75,000 TRY",
+            "Travel Rule applies (≥15,000 TRY)",
+            "Must collect/transmit originator and beneficiary information",
+            "Enhanced Due Diligence required (≥500,000 TRY)",
+            "Additional source of funds verification needed",
+            "Per Circular No. 29: Withdrawal delays may apply for first-time or high-risk withdrawals",
+        ])
+
+    def test_structuring_bit_per_threshold(self):
+        thresholds = MASAKThresholdCalculator.THRESHOLDS
+        for i, (key, value) in enumerate(thresholds.items()):
+            result = ThresholdResult(
+                TransactionType.CASH, 0.0, 0.0, False, "None", False, False,
+                NoteBit.STRUCTURING << i, average_amount_try=12_345.6,
+            )
+            self.assertEqual(result.notes, [
+                f"⚠️ STRUCTURING ALERT: Average transaction (12,346 TRY) "
+                f"is just below {key} threshold ({value:,} TRY)"
+            ])
+
+    def test_constructed_result_uses_default_text(self):
+        calculated = MASAKThresholdCalculator().calculate(TransactionType.CASH, 150_000)
+        constructed = ThresholdResult(
+            calculated.transaction_type,
+            calculated.amount_try,
+            calculated.amount_usd,
+            calculated.requires_reporting,
+            calculated.reporting_type,
+            calculated.travel_rule_applies,
+            calculated.edd_required,
+            calculated.notes_mask,
+        )
+        self.assertEqual(constructed, calculated)
+        self.assertEqual(hash(constructed), hash(calculated))
+        self.assertEqual(constructed.notes, calculated.notes)
+        self.assertEqual(repr(constructed), repr(calculated))
+        self.assertNotIn("note_lines", repr(calculated))
+
+    def test_notes_follow_calculator_thresholds(self):
+        class LowTravelRule(MASAKThresholdCalculator):
+            THRESHOLDS = {**MASAKThresholdCalculator.THRESHOLDS, "travel_rule": 1_000}
+
+        result = LowTravelRule().calculate(TransactionType.WIRE_TRANSFER, 2_000)
+        self.assertEqual(result.notes[0], "Travel Rule applies (≥1,000 TRY)")
+
+
+if __name__ == "__main__":
+    unittest.main()
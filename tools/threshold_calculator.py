@@ -7,11 +7,13 @@ for cryptocurrency transactions in Turkey.
 """
 
 import argparse
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntFlag
+from typing import Dict, List, Optional
 import json
+import sys
 
 
 class TransactionType(Enum):
@@ -25,9 +27,57 @@ class TransactionType(Enum):
     FIAT_WITHDRAWAL = "fiat_withdrawal"
 
 
-@dataclass
+# Integer encoding of TransactionType used by the array APIs (index = code)
+TRANSACTION_TYPE_ORDER = tuple(TransactionType)
+
+# TransactionType members by value, avoiding Enum construction
+_TT_BY_VALUE = {t.value: t for t in TransactionType}
+
+
+class NoteBit(IntFlag):
+    """Notes reported in ThresholdResult.notes_mask, in reporting order."""
+    REPORTING = 1
+    TRAVEL_RULE = 2
+    EDD = 4
+    CIRCULAR_29 = 8
+    # Structuring alert for the first THRESHOLDS key; the alert for the
+    # i-th key is STRUCTURING << i
+    STRUCTURING = 16
+
+
+# Plain-int note bits for calculate (IntFlag arithmetic is slow)
+_NOTE_REPORTING = int(NoteBit.REPORTING)
+_NOTE_TRAVEL_RULE = int(NoteBit.TRAVEL_RULE)
+_NOTE_EDD = int(NoteBit.EDD)
+_NOTE_CIRCULAR_29 = int(NoteBit.CIRCULAR_29)
+_NOTE_STRUCTURING = int(NoteBit.STRUCTURING)
+# REPORTING through CIRCULAR_29
+_BASE_NOTES = _NOTE_STRUCTURING - 1
+
+
+def _lines_by_mask(lines_by_bit: dict) -> tuple:
+    """
+    Note lines selected by each mask (index = mask).
+    
+    lines_by_bit maps consecutive bits from 1, in reporting order, to
+    their lines.
+    """
+    table = [()]
+    # Each bit doubles the table: masks with the bit set append its lines
+    for lines in lines_by_bit.values():
+        table += [selected + lines for selected in table]
+    return tuple(table)
+
+
+@dataclass(slots=True, frozen=True)
 class ThresholdResult:
-    """Result of threshold calculation."""
+    """
+    Result of threshold calculation.
+    
+    Notes are kept as a NoteBit mask; the text list is built on access
+    from the issuing calculator's note text, or the default calculator's
+    for results constructed directly.
+    """
     transaction_type: TransactionType
     amount_try: float
     amount_usd: float
@@ -35,7 +85,23 @@ class ThresholdResult:
     reporting_type: str
     travel_rule_applies: bool
     edd_required: bool
-    notes: list
+    notes_mask: int
+    # Average transaction amount quoted in structuring alerts
+    average_amount_try: float = 0.0
+    # Calculator note text for transaction_type: (lines per base-note mask,
+    # (bit, template) per structuring alert)
+    note_lines: tuple = field(default=(), repr=False, compare=False)
+    
+    @property
+    def notes(self) -> List[str]:
+        """Compliance notes, in reporting order."""
+        mask = self.notes_mask
+        lines_by_mask, structuring = self.note_lines or _DEFAULT_NOTE_LINES[self.transaction_type]
+        notes = list(lines_by_mask[mask & _BASE_NOTES])
+        if mask > _BASE_NOTES:
+            average = self.average_amount_try
+            notes += [template.format(average) for bit, template in structuring if mask & bit]
+        return notes
 
 
 class MASAKThresholdCalculator:
@@ -57,6 +123,17 @@ class MASAKThresholdCalculator:
         "large_crypto": 75_000,
     }
     
+    # Reporting threshold, report type and threshold label per transaction type
+    _HANDLERS = {
+        TransactionType.WIRE_TRANSFER: ("wire_transfer_reporting", "Large Transaction Report (same day)", "wire transfer"),
+        TransactionType.FIAT_DEPOSIT: ("wire_transfer_reporting", "Large Transaction Report (same day)", "wire transfer"),
+        TransactionType.FIAT_WITHDRAWAL: ("wire_transfer_reporting", "Large Transaction Report (same day)", "wire transfer"),
+        TransactionType.CASH: ("cash_reporting", "Cash Transaction Report (same day)", "cash"),
+        TransactionType.CRYPTO_DEPOSIT: ("large_crypto", "Large Transaction Report (same day)", "crypto"),
+        TransactionType.CRYPTO_WITHDRAWAL: ("large_crypto", "Large Transaction Report (same day)", "crypto"),
+        TransactionType.CRYPTO_TRANSFER: ("large_crypto", "Large Transaction Report (same day)", "crypto"),
+    }
+    
     # Approximate USD/TRY rate (volatile - update as needed)
     USD_TRY_RATE = 34.0  # As of Feb 2026
     
@@ -64,6 +141,54 @@ class MASAKThresholdCalculator:
         """Initialize calculator with optional exchange rate."""
         if usd_try_rate:
             self.USD_TRY_RATE = usd_try_rate
+        
+        self._reporting = {
+            tx_type: (self.THRESHOLDS[key], report_label)
+            for tx_type, (key, report_label, _) in self._HANDLERS.items()
+        }
+        
+        # Threshold values and notes are constant, so format them once per
+        # transaction type: the lines for each REPORTING..CIRCULAR_29 mask,
+        # and a (bit, template) per structuring alert, in reporting order
+        self._threshold_fmt = {key: f"{value:,}" for key, value in self.THRESHOLDS.items()}
+        self._structuring_bits = {
+            key: _NOTE_STRUCTURING << i for i, key in enumerate(self.THRESHOLDS)
+        }
+        common_lines = {
+            _NOTE_TRAVEL_RULE: (
+                f"Travel Rule applies (≥{self._threshold_fmt['travel_rule']} TRY)",
+                "Must collect/transmit originator and beneficiary information",
+            ),
+            _NOTE_EDD: (
+                f"Enhanced Due Diligence required (≥{self._threshold_fmt['edd_trigger']} TRY)",
+                "Additional source of funds verification needed",
+            ),
+            _NOTE_CIRCULAR_29: (
+                "Per Circular No. 29: Withdrawal delays may apply for first-time or high-risk withdrawals",
+            ),
+        }
+        structuring_lines = tuple(
+            (
+                bit,
+                "⚠️ STRUCTURING ALERT: Average transaction ({:,.0f} TRY) "
+                f"is just below {key} threshold ({self._threshold_fmt[key]} TRY)",
+            )
+            for key, bit in self._structuring_bits.items()
+        )
+        self._note_lines = {
+            tx_type: (
+                _lines_by_mask({
+                    _NOTE_REPORTING: (f"Exceeds {threshold_label} threshold of {self._threshold_fmt[key]} TRY",),
+                    **common_lines,
+                }),
+                structuring_lines,
+            )
+            for tx_type, (key, _, threshold_label) in self._HANDLERS.items()
+        }
+        
+        # Reporting threshold per TRANSACTION_TYPE_ORDER code, built on
+        # the first array call
+        self._reporting_thresholds = None
     
     def calculate(
         self,
@@ -95,62 +220,86 @@ class MASAKThresholdCalculator:
         reporting_type = "None"
         travel_rule_applies = False
         edd_required = False
-        notes = []
+        notes_mask = 0
         
         # Check thresholds based on transaction type
-        if transaction_type in (
-            TransactionType.WIRE_TRANSFER,
-            TransactionType.FIAT_DEPOSIT,
-            TransactionType.FIAT_WITHDRAWAL,
-        ):
-            if amount_try >= self.THRESHOLDS["wire_transfer_reporting"]:
-                requires_reporting = True
-                reporting_type = "Large Transaction Report (same day)"
-                notes.append(f"Exceeds wire transfer threshold of {self.THRESHOLDS['wire_transfer_reporting']:,} TRY")
-        
-        elif transaction_type == TransactionType.CASH:
-            if amount_try >= self.THRESHOLDS["cash_reporting"]:
-                requires_reporting = True
-                reporting_type = "Cash Transaction Report (same day)"
-                notes.append(f"Exceeds cash threshold of {self.THRESHOLDS['cash_reporting']:,} TRY")
-        
-        elif transaction_type in (
-            TransactionType.CRYPTO_DEPOSIT,
-            TransactionType.CRYPTO_WITHDRAWAL,
-            TransactionType.CRYPTO_TRANSFER,
-        ):
-            if amount_try >= self.THRESHOLDS["large_crypto"]:
-                requires_reporting = True
-                reporting_type = "Large Transaction Report (same day)"
-                notes.append(f"Exceeds crypto threshold of {self.THRESHOLDS['large_crypto']:,} TRY")
+        threshold, report_label = self._reporting[transaction_type]
+        if amount_try >= threshold:
+            requires_reporting = True
+            reporting_type = report_label
+            notes_mask |= _NOTE_REPORTING
         
         # Travel Rule check
         if amount_try >= self.THRESHOLDS["travel_rule"]:
             travel_rule_applies = True
-            notes.append(f"Travel Rule applies (≥{self.THRESHOLDS['travel_rule']:,} TRY)")
-            notes.append("Must collect/transmit originator and beneficiary information")
+            notes_mask |= _NOTE_TRAVEL_RULE
         
         # EDD check
         if amount_try >= self.THRESHOLDS["edd_trigger"]:
             edd_required = True
-            notes.append(f"Enhanced Due Diligence required (≥{self.THRESHOLDS['edd_trigger']:,} TRY)")
-            notes.append("Additional source of funds verification needed")
+            notes_mask |= _NOTE_EDD
         
         # Circular No. 29 notes for crypto
         if transaction_type == TransactionType.CRYPTO_WITHDRAWAL:
-            notes.append("Per Circular No. 29: Withdrawal delays may apply for first-time or high-risk withdrawals")
+            notes_mask |= _NOTE_CIRCULAR_29
         
+        # Positional: keyword arguments slow the frozen __init__ by a third
         return ThresholdResult(
-            transaction_type=transaction_type,
-            amount_try=amount_try,
-            amount_usd=amount_usd,
-            requires_reporting=requires_reporting,
-            reporting_type=reporting_type,
-            travel_rule_applies=travel_rule_applies,
-            edd_required=edd_required,
-            notes=notes,
+            transaction_type,
+            amount_try,
+            amount_usd,
+            requires_reporting,
+            reporting_type,
+            travel_rule_applies,
+            edd_required,
+            notes_mask,
+            0.0,  # average_amount_try
+            self._note_lines[transaction_type],  # note_lines
         )
     
+    def calculate_batch(
+        self,
+        tx_types,
+        amounts,
+        in_usd=False,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Calculate threshold requirements for many transactions at once.
+        
+        Args:
+            tx_types: Transaction types as indexes into TRANSACTION_TYPE_ORDER;
+                ValueError is raised for any other value
+            amounts: Transaction amounts
+            in_usd: Whether each amount is in USD rather than TRY
+            
+        Returns:
+            Dict of arrays: "amount_try", "amount_usd", "requires_reporting",
+            "travel_rule_applies" and "edd_required"
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("calculate_batch requires numpy") from None
+        
+        if self._reporting_thresholds is None:
+            self._reporting_thresholds = np.array([
+                self._reporting[t][0] for t in TRANSACTION_TYPE_ORDER
+            ], dtype=np.float64)
+        
+        tx_types = self._check_type_codes(np.asarray(tx_types))
+        amounts = np.asarray(amounts, dtype=np.float64)
+        in_usd = np.asarray(in_usd, dtype=bool)
+        amount_try = np.where(in_usd, amounts * self.USD_TRY_RATE, amounts)
+        amount_usd = np.where(in_usd, amounts, amounts / self.USD_TRY_RATE)
+        
+        return {
+            "amount_try": amount_try,
+            "amount_usd": amount_usd,
+            "requires_reporting": amount_try >= self._reporting_thresholds[tx_types],
+            "travel_rule_applies": amount_try >= self.THRESHOLDS["travel_rule"],
+            "edd_required": amount_try >= self.THRESHOLDS["edd_trigger"],
+        }
+    
     def calculate_cumulative(
         self,
         transactions: list,
@@ -162,32 +311,100 @@ class MASAKThresholdCalculator:
         MASAK requires cumulative analysis for structuring detection.
         """
         total_try = sum(t.get("amount_try", 0) for t in transactions)
-        total_usd = total_try / self.USD_TRY_RATE
         
         # Use most common transaction type, default to crypto_transfer
         tx_types = [t.get("type") for t in transactions]
-        most_common = max(set(tx_types), key=tx_types.count) if tx_types else "crypto_transfer"
+        most_common = Counter(tx_types).most_common(1)[0][0] if tx_types else "crypto_transfer"
         
+        tx_type = _TT_BY_VALUE.get(most_common, TransactionType.CRYPTO_TRANSFER)
+        
+        return self._cumulative_result(tx_type, total_try, len(transactions))
+    
+    def calculate_cumulative_array(
+        self,
+        amounts_try,
+        type_codes=None,
+        period_days: int = 1,
+    ) -> ThresholdResult:
+        """
+        Calculate cumulative thresholds from NumPy arrays.
+        
+        Vectorized counterpart of calculate_cumulative for large batches.
+        
+        Args:
+            amounts_try: Transaction amounts in Turkish Lira
+            type_codes: Optional transaction types as indexes into
+                TRANSACTION_TYPE_ORDER, one per amount; the most common one
+                is used, ties going to the type that occurs first
+            period_days: Period covered by the transactions
+            
+        Returns:
+            ThresholdResult for the cumulative amount
+        """
         try:
-            tx_type = TransactionType(most_common)
-        except ValueError:
-            tx_type = TransactionType.CRYPTO_TRANSFER
+            import numpy as np
+        except ImportError:
+            raise ImportError("calculate_cumulative_array requires numpy") from None
         
+        amounts_try = np.asarray(amounts_try, dtype=np.float64).ravel()
+        tx_type = TransactionType.CRYPTO_TRANSFER
+        if type_codes is not None:
+            type_codes = self._check_type_codes(np.asarray(type_codes).ravel())
+            if type_codes.size != amounts_try.size:
+                raise ValueError("type_codes must have one entry per amount")
+            if type_codes.size:
+                counts = np.bincount(type_codes, minlength=len(TRANSACTION_TYPE_ORDER))
+                most_common = (counts[type_codes] == counts.max()).argmax()
+                tx_type = TRANSACTION_TYPE_ORDER[type_codes[most_common]]
+        
+        return self._cumulative_result(tx_type, float(amounts_try.sum()), amounts_try.size)
+    
+    @staticmethod
+    def _check_type_codes(type_codes):
+        """Return type_codes, raising ValueError if any is not a TRANSACTION_TYPE_ORDER index."""
+        if type_codes.size and (type_codes.min() < 0 or type_codes.max() >= len(TRANSACTION_TYPE_ORDER)):
+            raise ValueError(
+                f"Transaction type codes must be between 0 and {len(TRANSACTION_TYPE_ORDER) - 1}"
+            )
+        return type_codes
+    
+    def _cumulative_result(
+        self,
+        tx_type: TransactionType,
+        total_try: float,
+        count: int,
+    ) -> ThresholdResult:
+        """Threshold result for a cumulative total, with structuring alerts."""
         result = self.calculate(tx_type, amount_try=total_try)
         
         # Add structuring warning
-        if len(transactions) > 1:
-            avg_amount = total_try / len(transactions)
+        if count > 1:
+            avg_amount = total_try / count
+            notes_mask = result.notes_mask
             for threshold_name, threshold_value in self.THRESHOLDS.items():
                 if 0.8 * threshold_value <= avg_amount < threshold_value:
-                    result.notes.append(
-                        f"⚠️ STRUCTURING ALERT: Average transaction ({avg_amount:,.0f} TRY) "
-                        f"is just below {threshold_name} threshold ({threshold_value:,} TRY)"
-                    )
+                    notes_mask |= self._structuring_bits[threshold_name]
+            # Positional, as in calculate; dataclasses.replace is slower still
+            result = ThresholdResult(
+                result.transaction_type,
+                result.amount_try,
+                result.amount_usd,
+                result.requires_reporting,
+                result.reporting_type,
+                result.travel_rule_applies,
+                result.edd_required,
+                notes_mask,
+                avg_amount,
+                result.note_lines,
+            )
         
         return result
 
 
+# Note text for ThresholdResults constructed without a calculator
+_DEFAULT_NOTE_LINES = MASAKThresholdCalculator()._note_lines
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -233,11 +450,14 @@ def main():
     amount_usd = args.amount if args.currency == "USD" else None
     
     result = calculator.calculate(
-        TransactionType(args.transaction_type),
+        _TT_BY_VALUE[args.transaction_type],
         amount_try=amount_try,
         amount_usd=amount_usd,
     )
     
+    # Formatted on access, so read the list once
+    notes = result.notes
+    
     if args.json:
         output = {
             "transaction_type": result.transaction_type.value,
@@ -247,27 +467,31 @@ def main():
             "reporting_type": result.reporting_type,
             "travel_rule_applies": result.travel_rule_applies,
             "edd_required": result.edd_required,
-            "notes": result.notes,
+            "notes": notes,
         }
-        print(json.dumps(output, indent=2))
+        lines = [json.dumps(output, indent=2)]
     else:
-        print(f"\n{'='*60}")
-        print("MASAK Threshold Analysis")
-        print(f"{'='*60}")
-        print(f"Transaction Type: {result.transaction_type.value}")
-        print(f"Amount: {result.amount_try:,.2f} TRY (~${result.amount_usd:,.2f} USD)")
-        print(f"{'='*60}")
-        print(f"Reporting Required: {'✅ YES' if result.requires_reporting else '❌ NO'}")
+        lines = [
+            f"\n{'='*60}",
+            "MASAK Threshold Analysis",
+            f"{'='*60}",
+            f"Transaction Type: {result.transaction_type.value}",
+            f"Amount: {result.amount_try:,.2f} TRY (~${result.amount_usd:,.2f} USD)",
+            f"{'='*60}",
+            f"Reporting Required: {'✅ YES' if result.requires_reporting else '❌ NO'}",
+        ]
         if result.requires_reporting:
-            print(f"  Report Type: {result.reporting_type}")
-        print(f"Travel Rule Applies: {'✅ YES' if result.travel_rule_applies else '❌ NO'}")
-        print(f"EDD Required: {'✅ YES' if result.edd_required else '❌ NO'}")
+            lines.append(f"  Report Type: {result.reporting_type}")
+        lines.append(f"Travel Rule Applies: {'✅ YES' if result.travel_rule_applies else '❌ NO'}")
+        lines.append(f"EDD Required: {'✅ YES' if result.edd_required else '❌ NO'}")
         
-        if result.notes:
-            print(f"\n📝 Notes:")
-            for note in result.notes:
-                print(f"  • {note}")
-        print(f"{'='*60}\n")
+        if notes:
+            lines.append(f"\n📝 Notes:")
+            lines.extend(f"  • {note}" for note in notes)
+        lines.append(f"{'='*60}\n")
+    
+    # Single write: one stdout lock and syscall instead of one per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":